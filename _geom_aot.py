@@ -0,0 +1,26 @@
+# _geom_aot.py
+# Purpose: Ahead-of-time compile the wedge vertex kernel from brickcalculator.py into an
+#          importable extension module (brick_geom), used in place of the NumPy kernel at run time.
+#          The build records a hash of the kernel source; brickcalculator ignores stale builds.
+# Usage: Run once after installing numba, and again whenever _wedge_verts changes:  python3 _geom_aot.py
+
+from numba.pycc import CC
+
+from brickcalculator import _wedge_verts, _wedge_kernel_hash
+
+
+KERNEL_HASH = _wedge_kernel_hash()
+
+
+def source_hash():
+    """Hash of the _wedge_verts source this module was built from."""
+    return KERNEL_HASH
+
+
+cc = CC('brick_geom')
+cc.export('wedge_verts', 'f8[:,:,:](f8,f8,i4)')(_wedge_verts)
+cc.export('source_hash', 'i8()')(source_hash)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -6,9 +6,27 @@
 #          with dimensions and miter angle callouts. Prints computed geometry to the terminal.
 # Usage: Run as a script. You will be prompted to enter values one at a time.
 
+import inspect
 import math
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon, Arc, Wedge
+import os
+import re
+import sys
+import warnings
+import zlib
+from collections import ChainMap
+from functools import lru_cache
+
+import numpy as np
+
+# matplotlib is imported lazily inside the plotting functions so the validation and
+# geometry code can be used (e.g. for parameter sweeps) without paying its import cost.
+
+# Script-only settings: BRICKCALC_SAVE names an output file; BRICKCALC_HEADLESS (or a non-tty
+# stdout) saves to DEFAULT_SAVE_PATH instead of opening a window. Both render with Agg.
+SAVE_PATH_ENV_VAR = "BRICKCALC_SAVE"
+HEADLESS_ENV_VAR = "BRICKCALC_HEADLESS"
+DEFAULT_SAVE_PATH = "brick_template.png"
+SAVE_DPI = 120
 
 
 # ==================== CONSTANTS ====================
@@ -19,6 +37,7 @@ FIGURE_HEIGHT = 6.3
 PLOT_MARGIN = 2.2
 TABLE_ROW_GAP = 1.2
 TABLE_Y_OFFSET = 0.5
+TABLE_LINE_SPACING = 1.3  # multiples of font size; matches TABLE_ROW_GAP at the example scale
 
 # Insulation visualization
 INSULATION_COLOR = "#FFE680"  # light yellow
@@ -34,18 +53,55 @@ ARC_LABEL_RADIUS_MULTIPLIER = 1.25
 MITER_ARC_RADIUS = 0.9
 MITER_REF_LINE_LENGTH = 1.4
 MITER_LABEL_FONT_SIZE = 8
+ARC_SAMPLE_COUNT = 16  # polyline samples per angle-callout arc
+
+# Unit-circle sample table (1-degree steps over 0..360), scaled by radius per use
+CIRCLE_SAMPLE_COUNT = 361
+_CIRCLE_DEG = np.linspace(0.0, 360.0, CIRCLE_SAMPLE_COUNT)
+_CIRCLE_UNIT = np.exp(1j * np.radians(_CIRCLE_DEG))
+_CIRCLE_COS = _CIRCLE_UNIT.real.copy()
+_CIRCLE_SIN = _CIRCLE_UNIT.imag.copy()
+# Table strides that split the circle evenly (divisors of 360), coarsest first
+_CIRCLE_STRIDES = tuple(stride for stride in range(CIRCLE_SAMPLE_COUNT - 1, 0, -1)
+                        if (CIRCLE_SAMPLE_COUNT - 1) % stride == 0)
+
+# Wedge ring vertices: rings of at least WEDGE_BLOCKED_MIN_BRICKS use blocked angle addition,
+# resyncing with an exact exp every WEDGE_RESYNC_STEPS points (below that one exp per point is faster)
+WEDGE_BLOCKED_MIN_BRICKS = 256
+WEDGE_RESYNC_STEPS = 16
+
+# Adaptive circle resolution: samples scale with radius, clamped to [min, table size]
+CIRCLE_MIN_SAMPLES = 64
+CIRCLE_SAMPLES_PER_INCH = 8
+
+# Interactive prompt validation (plain decimal / scientific notation; no inf/nan)
+FLOAT_INPUT_RE = re.compile(r'[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?')
+INT_INPUT_RE = re.compile(r'[-+]?\d+')
 
 
 # ==================== HELPER FUNCTIONS ====================
 
-def dim(ax, p1, p2, offset=(0, 0), text="", text_offset=(0, 0), lw=1):
-    """Engineering-style dimension with extension lines and <-> arrows."""
+def dim(ax, p1, p2, offset=(0, 0), text="", text_offset=(0, 0), lw=1, segments=None):
+    """Engineering-style dimension with extension lines and <-> arrows.
+
+    If segments (a list) is given, the extension lines are appended to it for the
+    caller to draw in one LineCollection instead of being added to ax here.
+    """
+    from matplotlib.lines import Line2D
+
     offset_x, offset_y = offset
     q1 = (p1[0] + offset_x, p1[1] + offset_y)
     q2 = (p2[0] + offset_x, p2[1] + offset_y)
 
-    ax.plot([p1[0], q1[0]], [p1[1], q1[1]], lw=lw, color='black')
-    ax.plot([p2[0], q2[0]], [p2[1], q2[1]], lw=lw, color='black')
+    if segments is not None:
+        segments.extend([(p1, q1), (p2, q2)])
+    else:
+        # Both extension lines in one artist; NaN breaks the path between them
+        ax.add_line(Line2D(
+            [p1[0], q1[0], np.nan, p2[0], q2[0]],
+            [p1[1], q1[1], np.nan, p2[1], q2[1]],
+            lw=lw, color='black'
+        ))
 
     ax.annotate(
         "",
@@ -58,76 +114,205 @@ def dim(ax, p1, p2, offset=(0, 0), text="", text_offset=(0, 0), lw=1):
     ax.text(text_x, text_y, text, fontsize=10, ha="center", va="center")
 
 
-def angle_arc(ax, center, start_deg, end_deg, radius, label, label_angle=None, lw=1):
-    """Arc + label for an angle callout."""
-    arc = Arc(center, 2 * radius, 2 * radius, theta1=start_deg, theta2=end_deg, lw=lw, color='black')
-    ax.add_patch(arc)
+def angle_arc(ax, center, start_deg, end_deg, radius, label, label_angle=None, lw=1, label_dir=None,
+              segments=None, label_offset=(0, 0), fontsize=10):
+    """Arc + label for an angle callout; returns the label Text.
+
+    Give either label_angle (degrees; defaults to mid-arc) or label_dir, a precomputed
+    (cos, sin) of it, not both. label_offset shifts the label from its point on the label
+    radius. If segments (a list) is given, the arc polyline is appended to it instead of
+    being added to ax here.
+
+    Raises:
+        ValueError: If both label_angle and label_dir are given
+    """
+    if label_angle is not None and label_dir is not None:
+        raise ValueError("Pass either label_angle or label_dir, not both.")
+
+    from matplotlib.lines import Line2D
+
+    # Short sampled polyline instead of an Arc patch's Bezier construction
+    theta = np.radians(np.linspace(start_deg, end_deg, ARC_SAMPLE_COUNT))
+    arc_xs = center[0] + radius * np.cos(theta)
+    arc_ys = center[1] + radius * np.sin(theta)
+    if segments is not None:
+        segments.append(np.column_stack([arc_xs, arc_ys]))
+    else:
+        ax.add_line(Line2D(arc_xs, arc_ys, lw=lw, color='black'))
 
-    if label_angle is None:
-        label_angle = (start_deg + end_deg) / 2
+    if label_dir is None:
+        if label_angle is None:
+            label_angle = (start_deg + end_deg) / 2
+        label_angle_rad = math.radians(label_angle)
+        label_dir = (math.cos(label_angle_rad), math.sin(label_angle_rad))
 
-    label_x = center[0] + ARC_LABEL_RADIUS_MULTIPLIER * radius * math.cos(math.radians(label_angle))
-    label_y = center[1] + ARC_LABEL_RADIUS_MULTIPLIER * radius * math.sin(math.radians(label_angle))
-    ax.text(label_x, label_y, label, fontsize=10, ha="center", va="center")
+    label_radius = ARC_LABEL_RADIUS_MULTIPLIER * radius
+    label_x = center[0] + label_radius * label_dir[0] + label_offset[0]
+    label_y = center[1] + label_radius * label_dir[1] + label_offset[1]
+    return ax.text(label_x, label_y, label, fontsize=fontsize, ha="center", va="center")
 
 
-def plot_circle(ax, radius, lw=1, color='black'):
-    """Plot a circle of a given radius using 0..360 degree sampling."""
-    angles_deg = range(361)
-    xs = [radius * math.cos(math.radians(deg)) for deg in angles_deg]
-    ys = [radius * math.sin(math.radians(deg)) for deg in angles_deg]
-    ax.plot(xs, ys, lw=lw, color=color)
+def circle_points(radius, n_samples=None):
+    """Return (xs, ys) sampled around a circle; sample count defaults to a radius-based resolution.
+
+    The count is rounded up to the nearest one that strides the 1-degree table evenly
+    (e.g. 64 -> 73, every 5 degrees), so no trig is evaluated here.
+    """
+    if n_samples is None:
+        n_samples = max(CIRCLE_MIN_SAMPLES, min(CIRCLE_SAMPLE_COUNT, int(CIRCLE_SAMPLES_PER_INCH * radius)))
+    stride = next((stride for stride in _CIRCLE_STRIDES
+                   if (CIRCLE_SAMPLE_COUNT - 1) // stride + 1 >= n_samples), 1)
+    return radius * _CIRCLE_COS[::stride], radius * _CIRCLE_SIN[::stride]
+
+
+@lru_cache(maxsize=64)
+def _unit_annulus_path(inner_ratio):
+    """Unit-outer-radius annulus Path (inner circle reversed so it cuts a hole); cached per ratio."""
+    from matplotlib.path import Path
+
+    unit_circle = Path.unit_circle()
+    verts = unit_circle.vertices
+    # Walk the Bezier circle backwards (MOVETO + 24 CURVE4 points), then re-append the CLOSEPOLY vertex
+    inner_verts = inner_ratio * np.concatenate([verts[-2::-1], verts[-2:-1]])
+    inner_circle = Path(inner_verts, unit_circle.codes)
+    return Path.make_compound_path(unit_circle, inner_circle)
+
+
+def plot_circles(ax, radii, colors, lw=1):
+    """Plot concentric unfilled circles as one PatchCollection (drawn at line z-order)."""
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Circle
+
+    circles = [Circle((0, 0), radius) for radius in radii]
+    ax.add_collection(
+        PatchCollection(circles, facecolors='none', edgecolors=colors, linewidths=lw, zorder=2)
+    )
+
+
+def _wedge_verts(inner_radius, outer_radius, num_bricks):
+    """Return an (N, 4, 2) float64 array of inner_pt0, inner_pt1, outer_pt1, outer_pt0 for each brick.
+
+    Plain NumPy at run time (already vectorized, so JIT would not pay for its compile);
+    the body stays numba-compatible so _geom_aot.py can build it ahead of time.
+    """
+    if num_bricks >= WEDGE_BLOCKED_MIN_BRICKS:
+        # Angle addition: each point is a block-start rotation times a small in-block offset,
+        # so only N/16 + 16 complex exps are evaluated and drift resets every block
+        step_rad = 2.0 * np.pi / num_bricks
+        num_blocks = num_bricks // WEDGE_RESYNC_STEPS + 1
+        block_starts = np.exp(1j * (step_rad * WEDGE_RESYNC_STEPS) * np.arange(num_blocks))
+        block_offsets = np.exp(1j * step_rad * np.arange(min(WEDGE_RESYNC_STEPS, num_bricks + 1)))
+        unit_pts = np.outer(block_starts, block_offsets).ravel()[:num_bricks + 1]
+    else:
+        # One complex exp yields cos (real) and sin (imag) together
+        unit_pts = np.exp(1j * np.linspace(0.0, 2.0 * np.pi, num_bricks + 1))
+    cos_t = unit_pts.real
+    sin_t = unit_pts.imag
+
+    verts = np.empty((num_bricks, 4, 2))
+    verts[:, 0, 0] = inner_radius * cos_t[:-1]
+    verts[:, 0, 1] = inner_radius * sin_t[:-1]
+    verts[:, 1, 0] = inner_radius * cos_t[1:]
+    verts[:, 1, 1] = inner_radius * sin_t[1:]
+    verts[:, 2, 0] = outer_radius * cos_t[1:]
+    verts[:, 2, 1] = outer_radius * sin_t[1:]
+    verts[:, 3, 0] = outer_radius * cos_t[:-1]
+    verts[:, 3, 1] = outer_radius * sin_t[:-1]
+    return verts
+
+
+def _wedge_kernel_hash():
+    """CRC32 of _wedge_verts' source and tuning constants; _geom_aot.py stores it in its build."""
+    source = inspect.getsource(_wedge_verts) + repr((WEDGE_BLOCKED_MIN_BRICKS, WEDGE_RESYNC_STEPS))
+    return zlib.crc32(source.encode("utf-8"))
+
+
+@lru_cache(maxsize=None)
+def _aot_wedge_verts():
+    """Ahead-of-time compiled wedge kernel (built by _geom_aot.py), or None if absent or stale."""
+    try:
+        import brick_geom
+    except ImportError:
+        return None
+
+    # Builds from an older _wedge_verts (or without a recorded hash) are ignored
+    source_hash = getattr(brick_geom, "source_hash", None)
+    if source_hash is None or source_hash() != _wedge_kernel_hash():
+        warnings.warn("brick_geom was built from a different _wedge_verts; ignoring it. "
+                      "Re-run _geom_aot.py to rebuild.", RuntimeWarning)
+        return None
+    return brick_geom.wedge_verts
+
+
+@lru_cache(maxsize=64)
+def _cached_wedge_verts(inner_radius, outer_radius, num_bricks):
+    """Memoized, read-only wedge vertex array; keys are pre-rounded by the caller."""
+    wedge_verts = _aot_wedge_verts() or _wedge_verts
+    verts = wedge_verts(inner_radius, outer_radius, num_bricks)
+    verts.flags.writeable = False
+    return verts
 
 
 def draw_wedge_bricks(ax, inner_radius, outer_radius, num_bricks):
-    """Draw N wedge bricks between inner_radius and outer_radius as 4-pt polygons."""
-    delta_theta_rad = 2 * math.pi / num_bricks
-    for i in range(num_bricks):
-        theta0 = i * delta_theta_rad
-        theta1 = (i + 1) * delta_theta_rad
-        inner_pt0 = (inner_radius * math.cos(theta0), inner_radius * math.sin(theta0))
-        inner_pt1 = (inner_radius * math.cos(theta1), inner_radius * math.sin(theta1))
-        outer_pt1 = (outer_radius * math.cos(theta1), outer_radius * math.sin(theta1))
-        outer_pt0 = (outer_radius * math.cos(theta0), outer_radius * math.sin(theta0))
-        ax.add_patch(Polygon([inner_pt0, inner_pt1, outer_pt1, outer_pt0], closed=True, fill=False, lw=1))
-
-
-def draw_miter_callout(ax, corner_pt, arc_start_deg, arc_end_deg, label_text, label_angle_deg, lw=1):
-    """Draw dashed vertical reference line and an angle arc/label for a miter callout."""
-    # Dashed vertical reference line
-    ax.plot(
-        [corner_pt[0], corner_pt[0]],
-        [corner_pt[1], corner_pt[1] - MITER_REF_LINE_LENGTH],
-        linestyle="--",
-        linewidth=1,
-        color='black'
+    """Draw N wedge bricks between inner_radius and outer_radius as one compound path of 4-pt polygons."""
+    from matplotlib.path import Path
+    from matplotlib.patches import PathPatch
+
+    # Round keys so FP noise in derived radii still hits the cache on repeat calls
+    verts = _cached_wedge_verts(
+        round(float(inner_radius), 12), round(float(outer_radius), 12), int(num_bricks)
     )
 
-    angle_arc(
+    # Repeat each brick's first vertex as the CLOSEPOLY target: (N, 5, 2) -> (5N, 2)
+    closed_verts = np.concatenate([verts, verts[:, :1]], axis=1).reshape(-1, 2)
+    codes = np.tile([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY], num_bricks)
+    ax.add_patch(PathPatch(Path(closed_verts, codes), fill=False, edgecolor='black', lw=1))
+
+
+def draw_miter_callout(ax, corner_pt, arc_start_deg, arc_end_deg, label_text, label_angle_deg=None, lw=1,
+                       label_dir=None, segments=None, arc_segments=None, label_offset=(0, 0)):
+    """Draw dashed vertical reference line and an angle arc/label for a miter callout; returns the label.
+
+    The label is placed by label_angle_deg or label_dir (see angle_arc), not both. If
+    segments / arc_segments (lists) are given, the reference line / arc polyline are
+    appended to them instead of drawn here.
+
+    Raises:
+        ValueError: If both label_angle_deg and label_dir are given (checked before drawing)
+    """
+    from matplotlib.lines import Line2D
+
+    if label_angle_deg is not None and label_dir is not None:
+        raise ValueError("Pass either label_angle_deg or label_dir, not both.")
+
+    # Dashed vertical reference line
+    ref_end_pt = (corner_pt[0], corner_pt[1] - MITER_REF_LINE_LENGTH)
+    if segments is not None:
+        segments.append((corner_pt, ref_end_pt))
+    else:
+        ax.add_line(Line2D(
+            [corner_pt[0], ref_end_pt[0]],
+            [corner_pt[1], ref_end_pt[1]],
+            linestyle="--",
+            linewidth=1,
+            color='black'
+        ))
+
+    return angle_arc(
         ax, corner_pt,
         start_deg=arc_start_deg,
         end_deg=arc_end_deg,
         radius=MITER_ARC_RADIUS,
         label=label_text,
         label_angle=label_angle_deg,
-        lw=lw
+        lw=lw,
+        label_dir=label_dir,
+        segments=arc_segments,
+        label_offset=label_offset,
+        fontsize=MITER_LABEL_FONT_SIZE
     )
 
 
-def tweak_last_two_angle_labels(ax, right_dx_dy, left_dx_dy):
-    """Shrink font and nudge left/right angle labels (assumes last two texts are angle labels)."""
-    for txt in ax.texts[-2:]:
-        txt.set_fontsize(MITER_LABEL_FONT_SIZE)
-
-    right_label = ax.texts[-1]
-    rx, ry = right_label.get_position()
-    right_label.set_position((rx + right_dx_dy[0], ry + right_dx_dy[1]))
-
-    left_label = ax.texts[-2]
-    lx, ly = left_label.get_position()
-    left_label.set_position((lx + left_dx_dy[0], ly + left_dx_dy[1]))
-
-
 # ==================== VALIDATION ====================
 
 def validate_inputs(barrel_diameter_in, brick_thickness_in, num_bricks,
@@ -157,23 +342,59 @@ def validate_inputs(barrel_diameter_in, brick_thickness_in, num_bricks,
 
 # ==================== GEOMETRY CALCULATIONS ====================
 
-def calculate_brick_geometry(barrel_diameter_in, brick_thickness_in, num_bricks,
-                            desired_brick_face_in, barrel_wall_thickness_in,
-                            insulation_thickness_in):
+# Order of the values produced by _geometry_core (size_adjusted is stored as 0.0/1.0)
+GEOMETRY_FIELDS = (
+    'barrel_inner_radius_in',
+    'barrel_outer_diameter_in',
+    'barrel_outer_radius_in',
+    'insulation_inner_radius_in',
+    'central_angle_deg',
+    'miter_angle_deg',
+    'miter_angle_rad',
+    'sin_half_central',
+    'cos_half_central',
+    'brick_outer_radius_in',
+    'brick_inner_radius_in',
+    'brick_ring_outer_diameter_in',
+    'brick_face_in',
+    'inner_face_in',
+    'taper_per_side_in',
+    'clear_opening_apothem_in',
+    'clear_opening_circumradius_in',
+    'clear_diameter_across_flats_in',
+    'clear_diameter_across_corners_in',
+    'inner_flats_circle_radius_in',
+    'brick_polygon_apothem_in',
+    'gap_max_in',
+    'gap_min_in',
+    'size_adjusted',
+)
+GEOMETRY_FIELD_COUNT = len(GEOMETRY_FIELDS)
+_FAILED_GEOMETRY = (math.nan,) * GEOMETRY_FIELD_COUNT
+
+# Status codes returned by _geometry_core for impossible geometry
+GEOMETRY_OK = 0
+GEOMETRY_ERRORS = {
+    1: "Insulation thickness is too large for the barrel inner diameter.",
+    2: "Brick thickness is too large for the brick ring radius.",
+    3: "Inner face computed <= 0. With these inputs, this wedge is not possible.",
+}
+
+
+def _geometry_core(barrel_diameter_in, brick_thickness_in, num_bricks,
+                   desired_brick_face_in, barrel_wall_thickness_in,
+                   insulation_thickness_in):
     """
-    Calculate all geometric dimensions for the brick ring.
+    Numeric core of calculate_brick_geometry.
 
-    Args:
-        barrel_diameter_in: Inside diameter of barrel (inches)
-        brick_thickness_in: Radial brick thickness (inches)
-        num_bricks: Number of bricks per ring
-        desired_brick_face_in: Desired outer face length of brick (inches)
-        barrel_wall_thickness_in: Thickness of barrel wall (inches)
-        insulation_thickness_in: Thickness of backup insulation (inches)
+    Runs as plain Python for single calls; _geometry_core_batch compiles it with numba.
 
     Returns:
-        Dictionary containing all calculated geometric values
+        (status, values): status is GEOMETRY_OK or a GEOMETRY_ERRORS key; values is a
+        tuple of floats ordered as GEOMETRY_FIELDS (all NaN when status is an error)
     """
+    failed = _FAILED_GEOMETRY
+
     # Basic barrel geometry
     barrel_inner_radius_in = barrel_diameter_in / 2.0
     barrel_outer_diameter_in = barrel_diameter_in + 2.0 * barrel_wall_thickness_in
@@ -182,75 +403,203 @@ def calculate_brick_geometry(barrel_diameter_in, brick_thickness_in, num_bricks,
     # Insulation layer (fixed thickness)
     insulation_inner_radius_in = barrel_inner_radius_in - insulation_thickness_in
     if insulation_inner_radius_in <= 0:
-        raise ValueError("Insulation thickness is too large for the barrel inner diameter.")
+        return 1, failed
 
     # Angle calculations
     central_angle_deg = 360.0 / num_bricks
     miter_angle_deg = 180.0 / num_bricks  # off-square per end
-    miter_angle_rad = math.radians(miter_angle_deg)
+
+    # Half the central angle equals the miter angle (pi / N); evaluate its trig once
+    half_central_rad = math.pi / num_bricks
+    miter_angle_rad = half_central_rad
+    sin_half_central = math.sin(half_central_rad)
+    cos_half_central = math.cos(half_central_rad)
+    tan_half_central = sin_half_central / cos_half_central
 
     # Determine actual brick size (may be reduced to fit)
-    desired_brick_outer_radius_in = desired_brick_face_in / (2.0 * math.sin(math.pi / num_bricks))
+    desired_brick_outer_radius_in = desired_brick_face_in / (2.0 * sin_half_central)
 
-    if desired_brick_outer_radius_in > insulation_inner_radius_in:
-        # Brick too large - use maximum size that fits
-        brick_outer_radius_in = insulation_inner_radius_in
-        brick_face_in = 2.0 * brick_outer_radius_in * math.sin(math.pi / num_bricks)
-        size_adjusted = True
-    else:
-        # Desired size fits
-        brick_outer_radius_in = desired_brick_outer_radius_in
-        brick_face_in = desired_brick_face_in
-        size_adjusted = False
+    # Clamp to the largest ring that fits inside the insulation (branchless)
+    brick_outer_radius_in = min(desired_brick_outer_radius_in, insulation_inner_radius_in)
+    size_adjusted = (brick_outer_radius_in < desired_brick_outer_radius_in) * 1.0
+    brick_face_in = 2.0 * brick_outer_radius_in * sin_half_central
 
     # Brick inner boundary
     brick_inner_radius_in = brick_outer_radius_in - brick_thickness_in
     if brick_inner_radius_in <= 0:
-        raise ValueError("Brick thickness is too large for the brick ring radius.")
+        return 2, failed
 
     brick_ring_outer_diameter_in = 2.0 * brick_outer_radius_in
 
     # Inner face length (trapezoid geometry)
-    inner_face_in = brick_face_in - 2.0 * brick_thickness_in * math.tan(miter_angle_rad)
+    inner_face_in = brick_face_in - 2.0 * brick_thickness_in * tan_half_central
     if inner_face_in <= 0:
-        raise ValueError("Inner face computed <= 0. With these inputs, this wedge is not possible.")
+        return 3, failed
 
     taper_per_side_in = (brick_face_in - inner_face_in) / 2.0
 
     # Clear opening dimensions (N-sided polygon formed by inner faces)
-    clear_opening_apothem_in = inner_face_in / (2.0 * math.tan(math.pi / num_bricks))
-    clear_opening_circumradius_in = inner_face_in / (2.0 * math.sin(math.pi / num_bricks))
+    clear_opening_apothem_in = inner_face_in / (2.0 * tan_half_central)
+    clear_opening_circumradius_in = inner_face_in / (2.0 * sin_half_central)
     clear_diameter_across_flats_in = 2.0 * clear_opening_apothem_in
     clear_diameter_across_corners_in = 2.0 * clear_opening_circumradius_in
 
+    # Circle that touches the inner brick faces (flats) of the drawn wedge ring
+    inner_flats_circle_radius_in = brick_inner_radius_in * cos_half_central
+
     # Gap between brick outer polygon and insulation inner circle
-    brick_polygon_apothem_in = brick_outer_radius_in * math.cos(math.pi / num_bricks)
+    brick_polygon_apothem_in = brick_outer_radius_in * cos_half_central
     gap_max_in = insulation_inner_radius_in - brick_polygon_apothem_in  # at face centers
     gap_min_in = insulation_inner_radius_in - brick_outer_radius_in     # at vertices
 
-    return {
-        'barrel_inner_radius_in': barrel_inner_radius_in,
-        'barrel_outer_diameter_in': barrel_outer_diameter_in,
-        'barrel_outer_radius_in': barrel_outer_radius_in,
-        'insulation_inner_radius_in': insulation_inner_radius_in,
-        'central_angle_deg': central_angle_deg,
-        'miter_angle_deg': miter_angle_deg,
-        'miter_angle_rad': miter_angle_rad,
-        'brick_outer_radius_in': brick_outer_radius_in,
-        'brick_inner_radius_in': brick_inner_radius_in,
-        'brick_ring_outer_diameter_in': brick_ring_outer_diameter_in,
-        'brick_face_in': brick_face_in,
-        'inner_face_in': inner_face_in,
-        'taper_per_side_in': taper_per_side_in,
-        'clear_opening_apothem_in': clear_opening_apothem_in,
-        'clear_opening_circumradius_in': clear_opening_circumradius_in,
-        'clear_diameter_across_flats_in': clear_diameter_across_flats_in,
-        'clear_diameter_across_corners_in': clear_diameter_across_corners_in,
-        'brick_polygon_apothem_in': brick_polygon_apothem_in,
-        'gap_max_in': gap_max_in,
-        'gap_min_in': gap_min_in,
-        'size_adjusted': size_adjusted
-    }
+    # Same order as GEOMETRY_FIELDS
+    values = (
+        barrel_inner_radius_in,
+        barrel_outer_diameter_in,
+        barrel_outer_radius_in,
+        insulation_inner_radius_in,
+        central_angle_deg,
+        miter_angle_deg,
+        miter_angle_rad,
+        sin_half_central,
+        cos_half_central,
+        brick_outer_radius_in,
+        brick_inner_radius_in,
+        brick_ring_outer_diameter_in,
+        brick_face_in,
+        inner_face_in,
+        taper_per_side_in,
+        clear_opening_apothem_in,
+        clear_opening_circumradius_in,
+        clear_diameter_across_flats_in,
+        clear_diameter_across_corners_in,
+        inner_flats_circle_radius_in,
+        brick_polygon_apothem_in,
+        gap_max_in,
+        gap_min_in,
+        size_adjusted,
+    )
+    return GEOMETRY_OK, values
+
+
+@lru_cache(maxsize=None)
+def _geometry_batch_kernel():
+    """Build the sweep kernel on first use; numba is imported only here (plain Python without it)."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        njit = None
+        prange = range
+
+    core = _geometry_core if njit is None else njit(cache=True)(_geometry_core)
+
+    def geometry_batch(barrel_diameter_in, brick_thickness_in, num_bricks,
+                       desired_brick_face_in, barrel_wall_thickness_in,
+                       insulation_thickness_in):
+        num_cases = barrel_diameter_in.shape[0]
+        results = np.empty((num_cases, GEOMETRY_FIELD_COUNT))
+        for i in prange(num_cases):
+            _, values = core(
+                barrel_diameter_in[i], brick_thickness_in[i], num_bricks[i],
+                desired_brick_face_in[i], barrel_wall_thickness_in[i], insulation_thickness_in[i]
+            )
+            for j in range(GEOMETRY_FIELD_COUNT):
+                results[i, j] = values[j]
+        return results
+
+    return geometry_batch if njit is None else njit(parallel=True, cache=True)(geometry_batch)
+
+
+def _geometry_core_batch(barrel_diameter_in, brick_thickness_in, num_bricks,
+                         desired_brick_face_in, barrel_wall_thickness_in,
+                         insulation_thickness_in):
+    """
+    Evaluate _geometry_core over equal-length 1-D parameter arrays (parametric sweeps).
+
+    Inputs are assumed to pass validate_inputs. Returns an (M, GEOMETRY_FIELD_COUNT)
+    array in GEOMETRY_FIELDS order; rows with impossible geometry are NaN.
+    """
+    return _geometry_batch_kernel()(
+        barrel_diameter_in, brick_thickness_in, num_bricks,
+        desired_brick_face_in, barrel_wall_thickness_in, insulation_thickness_in
+    )
+
+
+def calculate_brick_geometry(barrel_diameter_in, brick_thickness_in, num_bricks,
+                            desired_brick_face_in, barrel_wall_thickness_in,
+                            insulation_thickness_in):
+    """
+    Calculate all geometric dimensions for the brick ring.
+
+    Args:
+        barrel_diameter_in: Inside diameter of barrel (inches)
+        brick_thickness_in: Radial brick thickness (inches)
+        num_bricks: Number of bricks per ring
+        desired_brick_face_in: Desired outer face length of brick (inches)
+        barrel_wall_thickness_in: Thickness of barrel wall (inches)
+        insulation_thickness_in: Thickness of backup insulation (inches)
+
+    Returns:
+        Dictionary containing all calculated geometric values
+
+    Raises:
+        ValueError: If the geometry is impossible for these inputs
+    """
+    status, values = _geometry_core(
+        float(barrel_diameter_in), float(brick_thickness_in), int(num_bricks),
+        float(desired_brick_face_in), float(barrel_wall_thickness_in),
+        float(insulation_thickness_in)
+    )
+    if status != GEOMETRY_OK:
+        raise ValueError(GEOMETRY_ERRORS[status])
+
+    calcs = dict(zip(GEOMETRY_FIELDS, values))
+    calcs['size_adjusted'] = calcs['size_adjusted'] != 0.0
+    return calcs
+
+
+def calculate_brick_geometry_batch(barrel_diameter_in, brick_thickness_in, num_bricks,
+                                   desired_brick_face_in, barrel_wall_thickness_in,
+                                   insulation_thickness_in):
+    """
+    Calculate brick ring geometry for many parameter sets at once (parametric sweeps).
+
+    Each argument is a scalar or array-like; they are broadcast together and flattened.
+    The loop is compiled with numba when it is installed, and runs as plain Python otherwise.
+
+    Args:
+        barrel_diameter_in: Inside diameter(s) of barrel (inches)
+        brick_thickness_in: Radial brick thickness(es) (inches)
+        num_bricks: Number(s) of bricks per ring
+        desired_brick_face_in: Desired outer face length(s) of brick (inches)
+        barrel_wall_thickness_in: Thickness(es) of barrel wall (inches)
+        insulation_thickness_in: Thickness(es) of backup insulation (inches)
+
+    Returns:
+        Dictionary mapping each GEOMETRY_FIELDS name to a 1-D array. Cases whose geometry
+        is impossible are NaN (False for size_adjusted) rather than raising.
+
+    Raises:
+        ValueError: If any input value is invalid (same checks as validate_inputs)
+    """
+    floats = [np.asarray(value, dtype=np.float64) for value in (
+        barrel_diameter_in, brick_thickness_in, desired_brick_face_in,
+        barrel_wall_thickness_in, insulation_thickness_in
+    )]
+    bricks = np.asarray(num_bricks, dtype=np.int64)
+    diameter, thickness, face, wall, insulation, bricks = (
+        np.ascontiguousarray(array).ravel() for array in np.broadcast_arrays(*floats, bricks)
+    )
+
+    # Every validate_inputs check is a lower bound, so checking the minima checks all cases
+    # (saw kerf does not enter the geometry)
+    validate_inputs(diameter.min(), thickness.min(), bricks.min(), face.min(), 0.0,
+                    wall.min(), insulation.min())
+
+    results = _geometry_core_batch(diameter, thickness, bricks, face, wall, insulation)
+    sweep = {name: results[:, column] for column, name in enumerate(GEOMETRY_FIELDS)}
+    sweep['size_adjusted'] = sweep['size_adjusted'] == 1.0
+    return sweep
 
 
 # ==================== PLOTTING FUNCTIONS ====================
@@ -264,43 +613,49 @@ def plot_ring_view(ax, inputs, calcs):
         inputs: Dictionary of input parameters
         calcs: Dictionary of calculated values
     """
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import PathPatch
+    from matplotlib.transforms import Affine2D
+
     ax.set_aspect("equal", adjustable="box")
     ax.axis("off")
     ax.set_title("Top View", fontsize=12)
 
+    # Fix the view before adding artists so none of them trigger autoscaling
+    plot_limit = max(calcs['barrel_outer_radius_in'], calcs['barrel_inner_radius_in']) + PLOT_MARGIN
+    ax.set_xlim(-plot_limit, plot_limit)
+    ax.set_ylim(-(plot_limit + 8.0), plot_limit)
+    ax.set_autoscale_on(False)
+
     # Draw concentric circles (each with different color for visibility)
-    plot_circle(ax, calcs['barrel_inner_radius_in'], lw=1, color='blue')
-    plot_circle(ax, calcs['barrel_outer_radius_in'], lw=1, color='navy')
-    plot_circle(ax, calcs['brick_outer_radius_in'], lw=1, color='red')
-    plot_circle(ax, calcs['brick_inner_radius_in'], lw=1, color='orange')
-    # Circle that touches the inner brick faces (flats)
-    inner_flats_circle_radius = calcs['brick_inner_radius_in'] * math.cos(math.pi / inputs['num_bricks'])
-    plot_circle(ax, inner_flats_circle_radius, lw=1, color='green')
+    plot_circles(
+        ax,
+        radii=[calcs['barrel_inner_radius_in'], calcs['barrel_outer_radius_in'],
+               calcs['brick_outer_radius_in'], calcs['brick_inner_radius_in'],
+               calcs['inner_flats_circle_radius_in']],
+        colors=['blue', 'navy', 'red', 'orange', 'green'],
+        lw=1
+    )
 
     # Draw insulation annulus (shaded)
-    insulation_annulus = Wedge(
-        center=(0, 0),
-        r=calcs['barrel_inner_radius_in'],
-        theta1=0,
-        theta2=360,
-        width=inputs['insulation_thickness_in'],
+    outer_radius_in = calcs['barrel_inner_radius_in']
+    inner_ratio = round(calcs['insulation_inner_radius_in'] / outer_radius_in, 12)
+    insulation_annulus = PathPatch(
+        _unit_annulus_path(inner_ratio),
+        transform=Affine2D().scale(outer_radius_in) + ax.transData,
         color=INSULATION_COLOR,
         alpha=INSULATION_ALPHA
     )
     ax.add_patch(insulation_annulus)
 
     # Draw insulation inner boundary (dashed)
-    angles_deg = range(361)
-    xs = [calcs['insulation_inner_radius_in'] * math.cos(math.radians(deg)) for deg in angles_deg]
-    ys = [calcs['insulation_inner_radius_in'] * math.sin(math.radians(deg)) for deg in angles_deg]
-    ax.plot(xs, ys, lw=1, linestyle='--', color='black')
+    xs, ys = circle_points(calcs['insulation_inner_radius_in'])
+    ax.add_line(Line2D(xs, ys, lw=1, linestyle='--', color='black'))
 
     # Draw wedge bricks
     draw_wedge_bricks(ax, calcs['brick_inner_radius_in'], calcs['brick_outer_radius_in'], inputs['num_bricks'])
 
     # Add text table below diagram
-    plot_limit = max(calcs['barrel_outer_radius_in'], calcs['barrel_inner_radius_in']) + PLOT_MARGIN
-
     table_x = 0.0
     table_y_start = -(plot_limit + TABLE_Y_OFFSET)
 
@@ -321,15 +676,13 @@ def plot_ring_view(ax, inputs, calcs):
 
     all_rows = diameter_rows + thickness_rows
 
-    for i, (desc, val) in enumerate(all_rows):
-        ax.text(
-            table_x, table_y_start - i * TABLE_ROW_GAP,
-            f"{desc}: {val}",
-            fontsize=10, ha="center", va="center"
-        )
-
-    ax.set_xlim(-plot_limit, plot_limit)
-    ax.set_ylim(-(plot_limit + 8.0), plot_limit)
+    # One multi-line Text artist for the whole table; first row centered where the loop used to start
+    table_text = "\n".join(f"{desc}: {val}" for desc, val in all_rows)
+    ax.text(
+        table_x, table_y_start + TABLE_ROW_GAP / 2.0,
+        table_text,
+        fontsize=10, ha="center", va="top", linespacing=TABLE_LINE_SPACING
+    )
 
 
 def plot_brick_template(ax, inputs, calcs):
@@ -341,6 +694,9 @@ def plot_brick_template(ax, inputs, calcs):
         inputs: Dictionary of input parameters
         calcs: Dictionary of calculated values
     """
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
     ax.set_aspect("equal", adjustable="box")
     ax.axis("off")
 
@@ -350,6 +706,11 @@ def plot_brick_template(ax, inputs, calcs):
     taper_per_side_in = calcs['taper_per_side_in']
     miter_angle_deg = calcs['miter_angle_deg']
 
+    # Fix the view before adding artists so none of them trigger autoscaling
+    ax.set_xlim(-2.0, brick_face_in + 5.5)
+    ax.set_ylim(-3.0, brick_thickness_in + 3.0)
+    ax.set_autoscale_on(False)
+
     # Title
     brick_center_x = brick_face_in / 2.0
     title_y = brick_thickness_in + BRICK_TITLE_OFFSET_Y
@@ -370,36 +731,53 @@ def plot_brick_template(ax, inputs, calcs):
     inner_right_pt = (taper_per_side_in + inner_face_in, 0.0)
     inner_left_pt = (taper_per_side_in, 0.0)
 
-    ax.add_patch(
-        Polygon([outer_left_pt, outer_right_pt, inner_right_pt, inner_left_pt],
-                closed=True, fill=False, lw=2)
-    )
+    # Unfilled outline as a Line2D (no patch limit updates); the seam sits mid outer face
+    # with butt caps so all four corners get mitered joins
+    outline_pts = [(brick_center_x, brick_thickness_in), outer_right_pt, inner_right_pt,
+                   inner_left_pt, outer_left_pt, (brick_center_x, brick_thickness_in)]
+    outline_xs, outline_ys = zip(*outline_pts)
+    ax.add_line(Line2D(outline_xs, outline_ys, lw=2, color='black',
+                       solid_joinstyle='miter', solid_capstyle='butt'))
+
+    # Extension lines and miter arcs (solid) and miter reference lines (dashed) are collected
+    # and drawn as one LineCollection per line style
+    solid_segments = []
+    dashed_segments = []
 
     # Add dimension annotations
     dim(ax, outer_left_pt, outer_right_pt,
         offset=(0, 0.9),
         text=f"{brick_face_in:.3f} in  (Outer face)",
-        text_offset=(0, 0.25))
+        text_offset=(0, 0.25),
+        segments=solid_segments)
 
     dim(ax, inner_left_pt, inner_right_pt,
         offset=(0, -0.9),
         text=f"{inner_face_in:.3f} in  (Inner face)",
-        text_offset=(0, -0.25))
+        text_offset=(0, -0.25),
+        segments=solid_segments)
 
     dim(ax, (brick_face_in, 0.0), (brick_face_in, brick_thickness_in),
         offset=(1.3, 0),
         text=f"{brick_thickness_in:.3f} in  (Thickness)",
-        text_offset=(0.25, -1))
+        text_offset=(0.25, -1),
+        segments=solid_segments)
 
     dim(ax, (0.0, 0.0), (taper_per_side_in, 0.0),
         offset=(0, -1.6),
         text=f"{taper_per_side_in:.3f} in  (Taper each side)",
-        text_offset=(0, -0.25))
+        text_offset=(0, -0.25),
+        segments=solid_segments)
 
     # Miter angle callouts
     left_cut_angle_deg = MITER_REFERENCE_ANGLE_DEG + miter_angle_deg
     right_cut_angle_deg = MITER_REFERENCE_ANGLE_DEG - miter_angle_deg
 
+    # Label directions at 270° +/- half the miter angle share one sin/cos pair
+    half_miter_rad = math.radians(miter_angle_deg / 2.0)
+    cos_half_miter = math.cos(half_miter_rad)
+    sin_half_miter = math.sin(half_miter_rad)
+
     # Left miter callout
     draw_miter_callout(
         ax=ax,
@@ -407,8 +785,11 @@ def plot_brick_template(ax, inputs, calcs):
         arc_start_deg=MITER_REFERENCE_ANGLE_DEG,
         arc_end_deg=left_cut_angle_deg,
         label_text=f"{miter_angle_deg:.2f}°",
-        label_angle_deg=MITER_REFERENCE_ANGLE_DEG + miter_angle_deg / 2.0,
-        lw=1
+        lw=1,
+        label_dir=(sin_half_miter, -cos_half_miter),
+        segments=dashed_segments,
+        arc_segments=solid_segments,
+        label_offset=(-0.50, -0.05)
     )
 
     # Right miter callout
@@ -418,12 +799,20 @@ def plot_brick_template(ax, inputs, calcs):
         arc_start_deg=right_cut_angle_deg,
         arc_end_deg=MITER_REFERENCE_ANGLE_DEG,
         label_text=f"{miter_angle_deg:.2f}°",
-        label_angle_deg=MITER_REFERENCE_ANGLE_DEG - miter_angle_deg / 2.0,
-        lw=1
+        lw=1,
+        label_dir=(-sin_half_miter, -cos_half_miter),
+        segments=dashed_segments,
+        arc_segments=solid_segments,
+        label_offset=(0.50, -0.05)
     )
 
-    # Adjust miter label positions
-    tweak_last_two_angle_labels(ax, right_dx_dy=(0.50, -0.05), left_dx_dy=(-0.50, -0.05))
+    # Cap styles follow Line2D's defaults (projecting for solid, butt for dashed)
+    ax.add_collection(LineCollection(
+        solid_segments, colors='black', linewidths=1, capstyle='projecting'
+    ))
+    ax.add_collection(LineCollection(
+        dashed_segments, colors='black', linewidths=1, linestyles='--', capstyle='butt'
+    ))
 
     # Add info text
     ax.text(
@@ -435,55 +824,79 @@ def plot_brick_template(ax, inputs, calcs):
         fontsize=9.7, ha="center", va="center"
     )
 
-    ax.set_xlim(-2.0, brick_face_in + 5.5)
-    ax.set_ylim(-3.0, brick_thickness_in + 3.0)
-
 
 # ==================== OUTPUT FUNCTIONS ====================
 
+# Report templates, parsed once at import and filled with str.format_map
+_INPUTS_TEMPLATE = (
+    "\n=== INPUTS ===\n"
+    "N:                               {num_bricks}\n"
+    "Barrel inside diameter:          {barrel_diameter_in:.3f} in\n"
+    "Barrel wall thickness:           {barrel_wall_thickness_in:.3f} in\n"
+    "Backup insulation thickness:     {insulation_thickness_in:.3f} in\n"
+    "Brick thickness (radial):        {brick_thickness_in:.3f} in\n"
+    "Desired brick outer face length: {desired_brick_face_in:.3f} in\n"
+    "Saw kerf:                        {saw_kerf_in:.3f} in\n"
+)
+
+_ADJUSTED_TEMPLATE = (
+    "\n*** BRICK SIZE ADJUSTED TO FIT ***\n"
+    "Desired face length ({desired_brick_face_in:.3f} in) was too large.\n"
+    "Using maximum face length that fits: {brick_face_in:.3f} in\n"
+)
+
+_OUTPUTS_TEMPLATE = (
+    "\n=== OUTPUTS ===\n"
+    "Brick outer face length (actual): {brick_face_in:.3f} in\n"
+    "Central angle:                   {central_angle_deg:.3f}°\n"
+    "Miter angle per end:             {miter_angle_deg:.3f}° (off-square)\n"
+    "Brick ring outer radius:         {brick_outer_radius_in:.3f} in\n"
+    "Brick ring outer diameter:       {brick_ring_outer_diameter_in:.3f} in\n"
+    "Insulation inner radius:         {insulation_inner_radius_in:.3f} in\n"
+    "Inner face length:               {inner_face_in:.3f} in\n"
+    "Taper per side:                  {taper_per_side_in:.3f} in\n"
+    "Inner diameter across flats:     {clear_diameter_across_flats_in:.3f} in\n"
+    "Inner diameter across corners:   {clear_diameter_across_corners_in:.3f} in\n"
+    "Barrel outer diameter:           {barrel_outer_diameter_in:.3f} in\n"
+    "Gap at brick face centers (max): {gap_max_in:.3f} in\n"
+    "Gap at brick vertices (min):     {gap_min_in:.3f} in\n"
+)
+
+_RESULTS_TEMPLATE = _INPUTS_TEMPLATE + _OUTPUTS_TEMPLATE
+_RESULTS_ADJUSTED_TEMPLATE = _INPUTS_TEMPLATE + _ADJUSTED_TEMPLATE + _OUTPUTS_TEMPLATE
+
+
+def format_results(inputs, calcs):
+    """
+    Format all input parameters and calculated results as the terminal report.
+
+    Args:
+        inputs: Dictionary of input parameters
+        calcs: Dictionary of calculated values
+
+    Returns:
+        Multi-line report string (newline-terminated)
+    """
+    template = _RESULTS_ADJUSTED_TEMPLATE if calcs['size_adjusted'] else _RESULTS_TEMPLATE
+    return template.format_map(ChainMap(calcs, inputs))
+
+
 def print_results(inputs, calcs):
     """
-    Print all input parameters and calculated results to terminal.
+    Print all input parameters and calculated results to terminal in a single write.
 
     Args:
         inputs: Dictionary of input parameters
         calcs: Dictionary of calculated values
     """
-    print("\n=== INPUTS ===")
-    print(f"N:                               {inputs['num_bricks']}")
-    print(f"Barrel inside diameter:          {inputs['barrel_diameter_in']:.3f} in")
-    print(f"Barrel wall thickness:           {inputs['barrel_wall_thickness_in']:.3f} in")
-    print(f"Backup insulation thickness:     {inputs['insulation_thickness_in']:.3f} in")
-    print(f"Brick thickness (radial):        {inputs['brick_thickness_in']:.3f} in")
-    print(f"Desired brick outer face length: {inputs['desired_brick_face_in']:.3f} in")
-    print(f"Saw kerf:                        {inputs['saw_kerf_in']:.3f} in")
-
-    if calcs['size_adjusted']:
-        print(f"\n*** BRICK SIZE ADJUSTED TO FIT ***")
-        print(f"Desired face length ({inputs['desired_brick_face_in']:.3f} in) was too large.")
-        print(f"Using maximum face length that fits: {calcs['brick_face_in']:.3f} in")
-
-    print("\n=== OUTPUTS ===")
-    print(f"Brick outer face length (actual): {calcs['brick_face_in']:.3f} in")
-    print(f"Central angle:                   {calcs['central_angle_deg']:.3f}°")
-    print(f"Miter angle per end:             {calcs['miter_angle_deg']:.3f}° (off-square)")
-    print(f"Brick ring outer radius:         {calcs['brick_outer_radius_in']:.3f} in")
-    print(f"Brick ring outer diameter:       {calcs['brick_ring_outer_diameter_in']:.3f} in")
-    print(f"Insulation inner radius:         {calcs['insulation_inner_radius_in']:.3f} in")
-    print(f"Inner face length:               {calcs['inner_face_in']:.3f} in")
-    print(f"Taper per side:                  {calcs['taper_per_side_in']:.3f} in")
-    print(f"Inner diameter across flats:     {calcs['clear_diameter_across_flats_in']:.3f} in")
-    print(f"Inner diameter across corners:   {calcs['clear_diameter_across_corners_in']:.3f} in")
-    print(f"Barrel outer diameter:           {calcs['barrel_outer_diameter_in']:.3f} in")
-    print(f"Gap at brick face centers (max): {calcs['gap_max_in']:.3f} in")
-    print(f"Gap at brick vertices (min):     {calcs['gap_min_in']:.3f} in")
+    sys.stdout.write(format_results(inputs, calcs))
 
 
 # ==================== MAIN FUNCTION ====================
 
 def generate_brick_template(barrel_diameter_in, brick_thickness_in, num_bricks,
                            desired_brick_face_in, saw_kerf_in, barrel_wall_thickness_in,
-                           insulation_thickness_in):
+                           insulation_thickness_in, save_path=None, draw_figure=True):
     """
     Generate refractory brick lining template with diagrams and dimensions.
 
@@ -499,6 +912,11 @@ def generate_brick_template(barrel_diameter_in, brick_thickness_in, num_bricks,
         saw_kerf_in: Blade width (inches) - informational only
         barrel_wall_thickness_in: Thickness of barrel wall (inches) - diagram only
         insulation_thickness_in: Thickness of backup insulation (inches)
+        save_path: If given, write the figure to this file (e.g. .pdf/.png) instead of showing it
+        draw_figure: If False, only compute and print the geometry (no matplotlib figure)
+
+    Returns:
+        Dictionary containing all calculated geometric values
 
     Raises:
         ValueError: If inputs are invalid or geometry is impossible
@@ -525,43 +943,62 @@ def generate_brick_template(barrel_diameter_in, brick_thickness_in, num_bricks,
         desired_brick_face_in, barrel_wall_thickness_in, insulation_thickness_in
     )
 
+    # Print results to terminal
+    print_results(inputs, calcs)
+
+    # Text-only callers skip figure construction entirely
+    if not draw_figure:
+        return calcs
+
+    import matplotlib.pyplot as plt
+
     # Create figure with two subplots
-    fig, (ax_ring, ax_brick) = plt.subplots(1, 2, figsize=(FIGURE_WIDTH, FIGURE_HEIGHT))
+    fig, (ax_ring, ax_brick) = plt.subplots(
+        1, 2, figsize=(FIGURE_WIDTH, FIGURE_HEIGHT), layout='constrained'
+    )
     fig.suptitle(f"Template for {num_bricks}-Sided Brick Lining", fontsize=14)
 
     # Plot diagrams
     plot_ring_view(ax_ring, inputs, calcs)
     plot_brick_template(ax_brick, inputs, calcs)
 
-    # Print results to terminal
-    print_results(inputs, calcs)
+    # Save or display
+    if save_path:
+        fig.savefig(save_path, dpi=SAVE_DPI, bbox_inches='tight')
+        plt.close(fig)
+    else:
+        plt.show()
 
-    # Display
-    plt.tight_layout()
-    plt.show()
+    return calcs
 
 
 # ==================== INTERACTIVE ENTRY ====================
 
 if __name__ == "__main__":
 
+    # Without a terminal (piped output) or with BRICKCALC_HEADLESS set, save instead of showing
+    headless = bool(os.environ.get(HEADLESS_ENV_VAR)) or not sys.stdout.isatty()
+    script_save_path = os.environ.get(SAVE_PATH_ENV_VAR) or (DEFAULT_SAVE_PATH if headless else None)
+    if script_save_path:
+        # Select Agg before pyplot is first imported so no GUI toolkit is loaded
+        import matplotlib
+        matplotlib.use("Agg")
+
     def prompt_float(prompt_text):
         """Prompt for a floating point value with validation."""
         while True:
             user_input = input(prompt_text).strip()
-            try:
+            if FLOAT_INPUT_RE.fullmatch(user_input):
                 return float(user_input)
-            except ValueError:
-                print("  Invalid input. Please enter a numeric value.")
+            print("  Invalid input. Please enter a numeric value.")
 
     def prompt_int(prompt_text):
         """Prompt for an integer value with validation."""
         while True:
             user_input = input(prompt_text).strip()
-            try:
+            if INT_INPUT_RE.fullmatch(user_input):
                 return int(user_input)
-            except ValueError:
-                print("  Invalid input. Please enter an integer value.")
+            print("  Invalid input. Please enter an integer value.")
 
     print("\nRefractory Brick Lining Template Generator")
     print("Enter all dimensions in inches.\n")
@@ -581,6 +1018,10 @@ if __name__ == "__main__":
         desired_brick_face_in=brick_face,
         saw_kerf_in=saw_kerf,
         barrel_wall_thickness_in=barrel_wall,
-        insulation_thickness_in=insulation
+        insulation_thickness_in=insulation,
+        save_path=script_save_path
     )
 
+    if script_save_path:
+        print(f"\nTemplate saved to {script_save_path}")
+